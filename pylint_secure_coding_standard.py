@@ -23,10 +23,15 @@ from typing import ClassVar
 
 import astroid
 from pylint.checkers import BaseChecker
+from pylint.checkers.utils import only_required_for_messages
 
 # ==============================================================================
 # Helper functions
 
+# NB: The astroid node classes checked throughout this file (`Name`, `Attribute`, `Const`, `Call`, `BinOp`, `UnaryOp`)
+#     are never subclassed, so we compare classes by identity (`node.__class__ is astroid.Name`) instead of calling
+#     `isinstance()` in order to keep the checks performed on every node as cheap as possible.
+
 
 def _is_posix():
     """Return True if the current system is POSIX-compatible."""
@@ -37,6 +42,18 @@ def _is_posix():
 
 _is_unix = _is_posix
 
+
+def _is_windows():
+    """Return True if the current system is Windows."""
+    return platform.system() == 'Windows'
+
+
+# NB: the platform cannot change while linting, so only query it once. Tests need to patch these constants in addition
+#     to `platform.system()`.
+_IS_POSIX = _is_posix()
+_IS_UNIX = _is_unix()
+_IS_WINDOWS = _is_windows()
+
 # ==============================================================================
 
 
@@ -104,76 +121,76 @@ def _read_octal_mode_option(name, value, default):  # noqa: C901
 # ==============================================================================
 
 
-def _is_function_call(node, module, function):
-    if not isinstance(function, (list, tuple)):
-        function = (function,)
-    return (
-        isinstance(node.func, astroid.Attribute)
-        and isinstance(node.func.expr, astroid.Name)
-        and node.func.expr.name == module
-        and node.func.attrname in function
-    )
+_os_path_functions = frozenset({'abspath', 'relpath'})
 
 
-# ------------------------------------------------------------------------------
+def _get_os_path_call_module(func):
+    """Return the `xxx` node of an `astroid.Attribute` function node like `xxx.path.abspath` or `xxx.path.relpath`."""
+    if func.attrname not in _os_path_functions:
+        return None
+    expr = func.expr
+    if expr.__class__ is astroid.Attribute and expr.attrname == 'path' and expr.expr.__class__ is astroid.Name:
+        return expr.expr
+    return None
 
 
-def _is_os_path_call(node):
-    return (
-        isinstance(node.func, astroid.Attribute)
-        and (
-            (isinstance(node.func.expr, astroid.Name) and node.func.expr.name == 'op')
-            or (
-                isinstance(node.func.expr, astroid.Attribute)
-                and node.func.expr.attrname == 'path'
-                and isinstance(node.func.expr.expr, astroid.Name)
-                and node.func.expr.expr.name == 'os'
-            )
-        )
-        and node.func.attrname in {'abspath', 'relpath'}
-    )
+def _resolve_import_alias(node):
+    """Return the name of the module imported as `node.name` (e.g. `os` for `import os as o`), or None."""
+    _, assignments = node.lookup(node.name)
+    if len(assignments) == 1 and assignments[0].__class__ is astroid.Import:
+        for name, asname in assignments[0].names:
+            if asname == node.name:
+                return name
+    return None
 
 
-def _is_builtin_open_for_writing(node):
-    if isinstance(node.func, astroid.Name) and node.func.name == 'open':
-        mode = ''
-        if len(node.args) > 1:
-            if isinstance(node.args[1], astroid.Name):
-                return True  # variable -> to be on the safe side, flag as inappropriate
-            if isinstance(node.args[1], astroid.Const):
-                mode = node.args[1].value
-        elif node.keywords:
-            for keyword in node.keywords:
-                if keyword.arg == 'mode':
-                    if not isinstance(keyword.value, astroid.Const):
-                        return True  # variable -> to be on the safe side, flag as inappropriate
-                    mode = keyword.value.value
-                    break
-
-        if any(m in mode for m in 'awx'):
-            # Cover:
-            #  * open(..., "w").
-            #  * open(..., "wb").
-            #  * open(..., "a").
-            #  * open(..., "x").
-            return True
-    return False
+_open_write_mode_chars = frozenset('awx')
 
 
-def _get_mode_arg(node, args_idx):
-    mode = None
-    if len(node.args) > args_idx and isinstance(node.args[args_idx], astroid.Const):
-        mode = node.args[args_idx].value
-    elif node.keywords:
-        for keyword in node.keywords:
-            if keyword.arg == 'mode' and isinstance(keyword.value, astroid.Const):
-                mode = keyword.value.value
-                break
-    return mode
+def _get_keywords(node):
+    """Return the keyword arguments of an `astroid.Call` node indexed by their name."""
+    return {keyword.arg: keyword.value for keyword in node.keywords}
 
 
-def _is_allowed_mode(node, allowed_modes, args_idx):
-    mode = _get_mode_arg(node, args_idx=args_idx)
+def _open_call_is_writing(node, keywords):
+    """Return True if a call to the builtin `open()` opens a file for writing."""
+    mode = ''
+    if len(node.args) > 1:
+        mode_arg = node.args[1]
+        if mode_arg.__class__ is astroid.Name:
+            return True  # variable -> to be on the safe side, flag as inappropriate
+        if mode_arg.__class__ is astroid.Const:
+            mode = mode_arg.value
+    elif 'mode' in keywords:
+        if keywords['mode'].__class__ is not astroid.Const:
+            return True  # variable -> to be on the safe side, flag as inappropriate
+        mode = keywords['mode'].value
+
+    # Cover:
+    #  * open(..., "w").
+    #  * open(..., "wb").
+    #  * open(..., "a").
+    #  * open(..., "x").
+    return bool(mode) and not _open_write_mode_chars.isdisjoint(mode)
+
+
+def _get_mode_node(node, keywords, args_idx):
+    """Return the node of the `mode` argument of a function call (positional or keyword), or None if there is none."""
+    args = node.args
+    if len(args) > args_idx:
+        return args[args_idx]
+    return keywords.get('mode')
+
+
+def _get_mode_arg(node, keywords, args_idx):
+    mode = _get_mode_node(node, keywords, args_idx)
+    if mode.__class__ is astroid.Const:
+        return mode.value
+    return None
+
+
+def _is_allowed_mode(node, keywords, allowed_modes, args_idx):
+    mode = _get_mode_arg(node, keywords, args_idx=args_idx)
     if mode is not None:
         return mode in allowed_modes
 
@@ -181,106 +198,48 @@ def _is_allowed_mode(node, allowed_modes, args_idx):
     return True
 
 
-def _is_shell_true_call(node):
+def _is_shell_true_call(node, keywords):
+    """Return True if a `subprocess` function call (e.g. `subprocess.run()`) sets `shell=True`."""
     _n_args_max = 8
-    if not (isinstance(node.func, astroid.Attribute) and isinstance(node.func.expr, astroid.Name)):
-        return False
-
-    # subprocess module
-    if node.func.expr.name in {'subprocess', 'sp'}:
-        if node.func.attrname in {'call', 'check_call', 'check_output', 'Popen', 'run'}:
-            if node.keywords:
-                for keyword in node.keywords:
-                    if (
-                        keyword.arg == 'shell'
-                        and isinstance(keyword.value, astroid.Const)
-                        and bool(keyword.value.value)
-                    ):
-                        return True
-
-            if (
-                len(node.args) > _n_args_max
-                and isinstance(node.args[_n_args_max], astroid.Const)
-                and bool(node.args[_n_args_max].value)
-            ):
-                return True
-
-        if node.func.attrname in {'getoutput', 'getstatusoutput'}:
-            return True
-
-    # asyncio module
-    return (node.func.expr.name == 'asyncio' and node.func.attrname == 'create_subprocess_shell') or (
-        node.func.expr.name == 'loop' and node.func.attrname == 'subprocess_shell'
-    )
-
-
-def _is_pdb_call(node):
-    if (
-        isinstance(node.func, astroid.Attribute)
-        and isinstance(node.func.expr, astroid.Name)
-        and node.func.expr.name == 'pdb'
-    ):
-        # Cover:
+    shell = keywords.get('shell')
+    if shell.__class__ is astroid.Const and bool(shell.value):
         return True
 
-    # Cover:
-    return isinstance(node.func, astroid.Name) and node.func.name == 'Pdb'
+    args = node.args
+    if len(args) > _n_args_max:
+        shell = args[_n_args_max]
+        return shell.__class__ is astroid.Const and bool(shell.value)
+    return False
 
 
-def _is_mktemp_call(node):
-    if isinstance(node.func, astroid.Attribute) and node.func.attrname == 'mktemp':
-        # Cover:
-        #  * pdb.func().
-        return True
-    # Cover:
-    # * Pdb().
-    return isinstance(node.func, astroid.Name) and node.func.name == 'mktemp'
+_yaml_unsafe_loaders = frozenset({'Loader', 'UnsafeLoader', 'FullLoader'})
 
 
-def _is_yaml_unsafe_call(node):
+def _is_yaml_unsafe_load_call(node, keywords):
+    """Return True if a call to `yaml.load()` does not use a safe loader."""
     _load_n_args_max = 2
-    _safe_loaders = ('BaseLoader', 'SafeLoader')
-    _unsafe_loaders = ('Loader', 'UnsafeLoader', 'FullLoader')
-
-    if (
-        isinstance(node.func, astroid.Attribute)
-        and isinstance(node.func.expr, astroid.Name)
-        and node.func.expr.name == 'yaml'
-    ):
-        if node.func.attrname in {'unsafe_load', 'full_load'}:
-            # Cover:
-            #  * yaml.full_load().
-            #  * yaml.unsafe_load().
-            return True
-        if node.func.attrname == 'load' and node.keywords:
-            for keyword in node.keywords:
-                if keyword.arg == 'Loader' and isinstance(keyword.value, astroid.Name):
-                    if keyword.value.name in _unsafe_loaders:
-                        # Cover:
-                        #  * yaml.load(x, Loader=Loader).
-                        #  * yaml.load(x, Loader=UnsafeLoader).
-                        #  * yaml.load(x, Loader=FullLoader).
-                        return True
-                    if keyword.value.name in _safe_loaders:
-                        # Cover:
-                        #  * yaml.load(x, Loader=BaseLoader).
-                        #  * yaml.load(x, Loader=SafeLoader).
-                        return False
-        elif node.func.attrname == 'load' and (
-            len(node.args) < _load_n_args_max
-            or (isinstance(node.args[1], astroid.Name) and node.args[1].name in _unsafe_loaders)
-        ):
-            # Cover:
-            #  * yaml.load(x).
-            #  * yaml.load(x, Loader).
-            #  * yaml.load(x, UnsafeLoader).
-            #  * yaml.load(x, FullLoader).
-            return True
+
+    if keywords:
+        # Cover:
+        #  * yaml.load(x, Loader=Loader).
+        #  * yaml.load(x, Loader=UnsafeLoader).
+        #  * yaml.load(x, Loader=FullLoader).
+        # but not:
+        #  * yaml.load(x, Loader=BaseLoader).
+        #  * yaml.load(x, Loader=SafeLoader).
+        loader = keywords.get('Loader')
+        return loader.__class__ is astroid.Name and loader.name in _yaml_unsafe_loaders
 
     # Cover:
-    #  * unsafe_load(...).
-    #  * full_load(...).
-    return isinstance(node.func, astroid.Name) and node.func.name in {'unsafe_load', 'full_load'}
+    #  * yaml.load(x).
+    #  * yaml.load(x, Loader).
+    #  * yaml.load(x, UnsafeLoader).
+    #  * yaml.load(x, FullLoader).
+    args = node.args
+    if len(args) < _load_n_args_max:
+        return True
+    loader = args[1]
+    return loader.__class__ is astroid.Name and loader.name in _yaml_unsafe_loaders
 
 
 # ==============================================================================
@@ -297,27 +256,32 @@ _binop = {
     '|': operator.or_,
     '&': operator.and_,
 }
-_chmod_known_mode_values = (
-    'S_ISUID',
-    'S_ISGID',
-    'S_ENFMT',
-    'S_ISVTX',
-    'S_IREAD',
-    'S_IWRITE',
-    'S_IEXEC',
-    'S_IRWXU',
-    'S_IRUSR',
-    'S_IWUSR',
-    'S_IXUSR',
-    'S_IRWXG',
-    'S_IRGRP',
-    'S_IWGRP',
-    'S_IXGRP',
-    'S_IRWXO',
-    'S_IROTH',
-    'S_IWOTH',
-    'S_IXOTH',
-)
+_chmod_known_mode_values = {
+    name: getattr(stat, name)
+    for name in (
+        'S_ISUID',
+        'S_ISGID',
+        'S_ENFMT',
+        'S_ISVTX',
+        'S_IREAD',
+        'S_IWRITE',
+        'S_IEXEC',
+        'S_IRWXU',
+        'S_IRUSR',
+        'S_IWUSR',
+        'S_IXUSR',
+        'S_IRWXG',
+        'S_IRGRP',
+        'S_IWGRP',
+        'S_IXGRP',
+        'S_IRWXO',
+        'S_IROTH',
+        'S_IWOTH',
+        'S_IXOTH',
+    )
+}
+# pylint: disable-next=no-member
+_CHMOD_WX_FOR_GO_MASK = stat.S_IWGRP | stat.S_IXGRP | stat.S_IWOTH | stat.S_IXOTH
 
 
 def _chmod_get_mode(node):
@@ -330,51 +294,147 @@ def _chmod_get_mode(node):
     Raises:
         ValueError: if a node is encountered that cannot be processed
     """
-    if isinstance(node, astroid.Name) and node.name in _chmod_known_mode_values:
-        return getattr(stat, node.name)
-    if (
-        isinstance(node, astroid.Attribute)
-        and isinstance(node.expr, astroid.Name)
-        and node.attrname in _chmod_known_mode_values
-        and node.expr.name == 'stat'
-    ):
-        return getattr(stat, node.attrname)
-    if isinstance(node, astroid.UnaryOp):
-        return _unop[node.op](_chmod_get_mode(node.operand))
-    if isinstance(node, astroid.BinOp):
-        return _binop[node.op](_chmod_get_mode(node.left), _chmod_get_mode(node.right))
-
-    msg = f'Do not know how to process node: {node.repr_tree()}'
-    raise ValueError(msg)
-
-
-def _chmod_has_wx_for_go(node):
-    if platform.system() == 'Windows':
+    # NB: the expression is evaluated in postfix order using an explicit stack instead of recursing into the operands of
+    #     each operator. Operators are pushed as `(function, number_of_operands)` tuples after their operands.
+    operands = []
+    todo = [node]
+    while todo:
+        item = todo.pop()
+        if item.__class__ is tuple:
+            function, n_operands = item
+            if n_operands == 1:
+                operands.append(function(operands.pop()))
+            else:
+                right = operands.pop()
+                operands[-1] = function(operands[-1], right)
+            continue
+
+        if item.__class__ is astroid.Name:
+            mode = _chmod_known_mode_values.get(item.name)
+            if mode is not None:
+                operands.append(mode)
+                continue
+        elif item.__class__ is astroid.Attribute:
+            mode = _chmod_known_mode_values.get(item.attrname)
+            if mode is not None and item.expr.__class__ is astroid.Name and item.expr.name == 'stat':
+                operands.append(mode)
+                continue
+        elif item.__class__ is astroid.UnaryOp:
+            todo.extend(((_unop[item.op], 1), item.operand))
+            continue
+        elif item.__class__ is astroid.BinOp:
+            todo.extend(((_binop[item.op], 2), item.right, item.left))
+            continue
+
+        msg = f'Do not know how to process node: {item.repr_tree()}'
+        raise ValueError(msg)
+    return operands[0]
+
+
+def _chmod_has_wx_for_go(node, keywords):
+    if _IS_WINDOWS:
         # On Windows, only stat.S_IREAD and stat.S_IWRITE can be used, all other bits are ignored
         return False
 
+    mode = _get_mode_node(node, keywords, args_idx=1)
+    if mode is None:
+        # NB: this would be from invalid code such as `os.chmod("file.txt")`
+        msg = 'Unable to extract `mode` argument from function call!'
+        raise RuntimeError(msg)
+
     try:
-        modes = None
-        if len(node.args) > 1:
-            modes = _chmod_get_mode(node.args[1])
-        elif node.keywords:
-            for keyword in node.keywords:
-                if keyword.arg == 'mode':
-                    modes = _chmod_get_mode(keyword.value)
-                    break
+        return bool(_chmod_get_mode(mode) & _CHMOD_WX_FOR_GO_MASK)
     except ValueError:
         return False
-    else:
-        if modes is None:
-            # NB: this would be from invalid code such as `os.chmod("file.txt")`
-            msg = 'Unable to extract `mode` argument from function call!'
-            raise RuntimeError(msg)
-        # pylint: disable=no-member
-        return bool(modes & (stat.S_IWGRP | stat.S_IXGRP | stat.S_IWOTH | stat.S_IXOTH))
 
 
 # ==============================================================================
 
+_debug_modules = frozenset({'pdb'})
+
+# NB: maps the name of the module of a `from xxx import yyy` statement to a sequence of
+#     `(names, msg_id, non_posix_only)` rules, where `names` are the imported names that trigger the message (`None`
+#     meaning any name) and `non_posix_only` whether the message is only emitted on non-POSIX platforms. Only the first
+#     matching rule of a module emits its message.
+_importfrom_dispatch = {
+    'pdb': ((None, 'avoid-debug-stmt', False),),
+    'tempfile': ((frozenset({'mktemp'}), 'replace-mktemp', False),),
+    'os.path': ((frozenset({'relpath', 'abspath'}), 'replace-os-relpath-abspath', False),),
+    'op': ((frozenset({'relpath', 'abspath'}), 'replace-os-relpath-abspath', False),),
+    'subprocess': ((frozenset({'getoutput', 'getstatusoutput'}), 'avoid-shell-true', False),),
+    'asyncio': ((frozenset({'create_subprocess_shell'}), 'avoid-shell-true', False),),
+    'os': ((frozenset({'system'}), 'avoid-os-system', False), (frozenset({'popen'}), 'avoid-os-popen', False)),
+    'shlex': ((frozenset({'quote'}), 'avoid-shlex-quote-on-non-posix', True),),
+    'pickle': ((frozenset({'load', 'loads'}), 'avoid-pickle-load', False),),
+    'marshal': ((frozenset({'load', 'loads'}), 'avoid-marshal-load', False),),
+    'shelve': ((frozenset({'open'}), 'avoid-shelve-open', False),),
+}
+
+
+# NB: calls are dispatched on the name of the function (e.g. `eval()`) or on the `(module, function)` pair (e.g.
+#     `os.system()`), with `None` acting as a wildcard for either of the pair. Values are either a message ID or a
+#     checker method registered with `_handles_calls()` that performs any further checks on the call arguments.
+_name_call_handlers = {
+    'Pdb': 'avoid-debug-stmt',
+    'mktemp': 'replace-mktemp',
+    'unsafe_load': 'avoid-yaml-unsafe-load',
+    'full_load': 'avoid-yaml-unsafe-load',
+    'eval': 'avoid-eval-exec',
+    'exec': 'avoid-eval-exec',
+}
+_attr_call_handlers = {
+    ('pdb', None): 'avoid-debug-stmt',
+    (None, 'mktemp'): 'replace-mktemp',
+    ('yaml', 'unsafe_load'): 'avoid-yaml-unsafe-load',
+    ('yaml', 'full_load'): 'avoid-yaml-unsafe-load',
+    ('jsonpickle', 'decode'): 'avoid-jsonpickle-decode',
+    ('os', 'system'): 'avoid-os-system',
+    ('op', 'abspath'): 'replace-os-relpath-abspath',
+    ('op', 'relpath'): 'replace-os-relpath-abspath',
+    ('asyncio', 'create_subprocess_shell'): 'avoid-shell-true',
+    ('loop', 'subprocess_shell'): 'avoid-shell-true',
+    ('subprocess', 'getoutput'): 'avoid-shell-true',
+    ('subprocess', 'getstatusoutput'): 'avoid-shell-true',
+    ('sp', 'getoutput'): 'avoid-shell-true',
+    ('sp', 'getstatusoutput'): 'avoid-shell-true',
+    ('os', 'popen'): 'avoid-os-popen',
+    ('pickle', 'load'): 'avoid-pickle-load',
+    ('pickle', 'loads'): 'avoid-pickle-load',
+    ('marshal', 'load'): 'avoid-marshal-load',
+    ('marshal', 'loads'): 'avoid-marshal-load',
+    ('shelve', 'open'): 'avoid-shelve-open',
+}
+
+# NB: maps the `os` functions whose mode is checked against one of the `os-*-mode` options to a tuple of the names of
+#     the checker attributes holding the allowed modes and the message argument for that option, the message ID, the
+#     index of the positional mode argument and whether the check only applies on UNIX.
+_os_mode_checks = {
+    'open': ('_os_open_modes_allowed', '_os_open_msg_arg', 'os-open-unsafe-permissions', 2, False),
+    'mkdir': ('_os_mkdir_modes_allowed', '_os_mkdir_msg_arg', 'os-mkdir-unsafe-permissions', 1, True),
+    'makedirs': ('_os_mkdir_modes_allowed', '_os_mkdir_msg_arg', 'os-mkdir-unsafe-permissions', 1, True),
+    'mkfifo': ('_os_mkfifo_modes_allowed', '_os_mkfifo_msg_arg', 'os-mkfifo-unsafe-permissions', 1, True),
+    'mknod': ('_os_mknod_modes_allowed', '_os_mknod_msg_arg', 'os-mknod-unsafe-permissions', 1, True),
+}
+
+
+def _handles_calls(*keys):
+    """
+    Register a checker method as the handler of some function calls.
+
+    Args:
+        keys: Function names (e.g. `'open'`) or `(module, function)` pairs (e.g. `('os', 'open')`) handled by the method
+    """
+
+    def _register(method):
+        for key in keys:
+            if isinstance(key, str):
+                _name_call_handlers[key] = method
+            else:
+                _attr_call_handlers[key] = method
+        return method
+
+    return _register
+
 
 class SecureCodingStandardChecker(BaseChecker):  # pylint: disable=too-many-instance-attributes
     """Plugin class."""
@@ -530,121 +590,232 @@ class SecureCodingStandardChecker(BaseChecker):  # pylint: disable=too-many-inst
         """Initialize a SecureCodingStandardChecker object."""
         super().__init__(linter)
         self._os_open_msg_arg = ''
-        self._os_open_modes_allowed = []
+        self._os_open_modes_allowed = frozenset()
         self._os_mkdir_msg_arg = ''
-        self._os_mkdir_modes_allowed = []
+        self._os_mkdir_modes_allowed = frozenset()
         self._os_mkfifo_msg_arg = ''
-        self._os_mkfifo_modes_allowed = []
+        self._os_mkfifo_modes_allowed = frozenset()
         self._os_mknod_msg_arg = ''
-        self._os_mknod_modes_allowed = []
-
-    def visit_call(self, node):  # pylint: disable=too-many-branches # noqa: PLR0912, C901
+        self._os_mknod_modes_allowed = frozenset()
+        self._unsafe_open_calls = {}
+        self._import_aliases = set()
+
+        self._build_call_dispatch(lambda _msg_id: True)
+
+    def open(self):
+        """Initialize the call dispatch tables with the checks for the enabled messages only."""
+        self._build_call_dispatch(self.linter.is_message_enabled)
+
+    def _build_call_dispatch(self, is_message_enabled):
+        def _is_enabled(handler):
+            msg_ids = (handler,) if isinstance(handler, str) else handler.checks_msgs
+            return any(is_message_enabled(msg_id) for msg_id in msg_ids)
+
+        self._name_call_dispatch = {key: value for key, value in _name_call_handlers.items() if _is_enabled(value)}
+        self._attr_call_dispatch = {key: value for key, value in _attr_call_handlers.items() if _is_enabled(value)}
+        self._check_os_path_calls = is_message_enabled('replace-os-relpath-abspath')
+
+        # NB: most calls are made on objects that are not any of the modules above, which we can reject without having
+        #     to build any lookup key
+        self._call_modules = frozenset(module for module, _ in self._attr_call_dispatch if module is not None)
+        self._alias_modules = self._call_modules | {'os'} if self._check_os_path_calls else self._call_modules
+
+    @only_required_for_messages(
+        'replace-os-relpath-abspath',
+        'avoid-eval-exec',
+        'avoid-os-system',
+        'avoid-shell-true',
+        'replace-mktemp',
+        'avoid-yaml-unsafe-load',
+        'avoid-jsonpickle-decode',
+        'avoid-debug-stmt',
+        'replace-builtin-open',
+        'avoid-os-popen',
+        'avoid-shlex-quote-on-non-posix',
+        'os-open-unsafe-permissions',
+        'avoid-pickle-load',
+        'avoid-marshal-load',
+        'avoid-shelve-open',
+        'os-mkdir-unsafe-permissions',
+        'os-mkfifo-unsafe-permissions',
+        'os-mknod-unsafe-permissions',
+        'os-chmod-unsafe-permissions',
+    )
+    def visit_call(self, node):
         """Visitor method called for astroid.Call nodes."""
-        if _is_pdb_call(node):
-            self.add_message('avoid-debug-stmt', node=node)
-        elif _is_mktemp_call(node):
-            self.add_message('replace-mktemp', node=node)
-        elif _is_yaml_unsafe_call(node):
+        func = node.func
+        if func.__class__ is astroid.Name:
+            handler = self._name_call_dispatch.get(func.name)
+        elif func.__class__ is astroid.Attribute:
+            handler = self._get_attr_call_handler(func)
+        else:
+            return
+
+        if handler is None:
+            return
+        if isinstance(handler, str):
+            self.add_message(handler, node=node)
+        else:
+            handler(self, node, _get_keywords(node))
+
+    def _get_attr_call_handler(self, func):
+        attrname = func.attrname
+        expr = func.expr
+        if expr.__class__ is astroid.Name:
+            module = expr.name
+            if module in self._import_aliases:
+                # NB: only look up the names that were imported as an alias of one of the modules we check, since name
+                #     lookups are much more expensive than the set membership test above
+                module = _resolve_import_alias(expr) or module
+            if module in self._call_modules:
+                handler = self._attr_call_dispatch.get((module, attrname))
+                if handler is None:
+                    handler = self._attr_call_dispatch.get((module, None))
+                if handler is not None:
+                    return handler
+
+        handler = self._attr_call_dispatch.get((None, attrname))
+        if handler is None and self._check_os_path_calls:
+            module = _get_os_path_call_module(func)
+            if module is not None and self._get_module_name(module) == 'os':
+                return 'replace-os-relpath-abspath'
+        return handler
+
+    def _get_module_name(self, node):
+        """Return the name of the module an `astroid.Name` node refers to, resolving `import xxx as yyy` aliases."""
+        name = node.name
+        if name in self._import_aliases:
+            return _resolve_import_alias(node) or name
+        return name
+
+    @_handles_calls('open')
+    @only_required_for_messages('replace-builtin-open')
+    def _check_builtin_open(self, node, keywords):
+        if not self._os_open_modes_allowed:
+            return
+        unsafe = self._unsafe_open_calls.pop(node, None)
+        if unsafe is None:
+            unsafe = _open_call_is_writing(node, keywords)
+        if unsafe:
+            self.add_message('replace-builtin-open', node=node)
+
+    @_handles_calls(('yaml', 'load'))
+    @only_required_for_messages('avoid-yaml-unsafe-load')
+    def _check_yaml_load(self, node, keywords):
+        if _is_yaml_unsafe_load_call(node, keywords):
             self.add_message('avoid-yaml-unsafe-load', node=node)
-        elif _is_function_call(node, module='jsonpickle', function='decode'):
-            self.add_message('avoid-jsonpickle-decode', node=node)
-        elif _is_function_call(node, module='os', function='system'):
-            self.add_message('avoid-os-system', node=node)
-        elif _is_os_path_call(node):
-            self.add_message('replace-os-relpath-abspath', node=node)
-        elif _is_shell_true_call(node):
+
+    @_handles_calls(
+        ('subprocess', 'call'),
+        ('subprocess', 'check_call'),
+        ('subprocess', 'check_output'),
+        ('subprocess', 'Popen'),
+        ('subprocess', 'run'),
+        ('sp', 'call'),
+        ('sp', 'check_call'),
+        ('sp', 'check_output'),
+        ('sp', 'Popen'),
+        ('sp', 'run'),
+    )
+    @only_required_for_messages('avoid-shell-true')
+    def _check_shell_true(self, node, keywords):
+        if _is_shell_true_call(node, keywords):
             self.add_message('avoid-shell-true', node=node)
-        elif _is_function_call(node, module='os', function='popen'):
-            self.add_message('avoid-os-popen', node=node)
-        elif _is_builtin_open_for_writing(node) and self._os_open_modes_allowed:
-            self.add_message('replace-builtin-open', node=node)
-        elif isinstance(node.func, astroid.Name) and (node.func.name in {'eval', 'exec'}):
-            self.add_message('avoid-eval-exec', node=node)
-        elif not _is_posix() and _is_function_call(node, module='shlex', function='quote'):
+
+    @_handles_calls(('shlex', 'quote'))
+    @only_required_for_messages('avoid-shlex-quote-on-non-posix')
+    def _check_shlex_quote(self, node, _keywords):
+        if not _IS_POSIX:
             self.add_message('avoid-shlex-quote-on-non-posix', node=node)
-        elif (
-            _is_function_call(node, module='os', function='open')
-            and self._os_open_modes_allowed
-            and not _is_allowed_mode(node, self._os_open_modes_allowed, args_idx=2)
-        ):
-            self.add_message('os-open-unsafe-permissions', node=node, args=(self._os_open_msg_arg,))
-        elif _is_function_call(node, module='pickle', function=('load', 'loads')):
-            self.add_message('avoid-pickle-load', node=node)
-        elif _is_function_call(node, module='marshal', function=('load', 'loads')):
-            self.add_message('avoid-marshal-load', node=node)
-        elif _is_function_call(node, module='shelve', function='open'):
-            self.add_message('avoid-shelve-open', node=node)
-        elif _is_function_call(node, module='os', function='chmod') and _chmod_has_wx_for_go(node):
+
+    @_handles_calls(('os', 'chmod'))
+    @only_required_for_messages('os-chmod-unsafe-permissions')
+    def _check_os_chmod(self, node, keywords):
+        if _chmod_has_wx_for_go(node, keywords):
             self.add_message('os-chmod-unsafe-permissions', node=node)
-        elif _is_unix():
-            if (
-                _is_function_call(node, module='os', function=('mkdir', 'makedirs'))
-                and self._os_mkdir_modes_allowed
-                and not _is_allowed_mode(node, self._os_mkdir_modes_allowed, args_idx=1)
-            ):
-                self.add_message('os-mkdir-unsafe-permissions', node=node, args=(self._os_mkdir_msg_arg,))
-            elif (
-                _is_function_call(node, module='os', function='mkfifo')
-                and self._os_mkfifo_modes_allowed
-                and not _is_allowed_mode(node, self._os_mkfifo_modes_allowed, args_idx=1)
-            ):
-                self.add_message('os-mkfifo-unsafe-permissions', node=node, args=(self._os_mkfifo_msg_arg,))
-            elif (
-                _is_function_call(node, module='os', function='mknod')
-                and self._os_mknod_modes_allowed
-                and not _is_allowed_mode(node, self._os_mknod_modes_allowed, args_idx=1)
-            ):
-                self.add_message('os-mknod-unsafe-permissions', node=node, args=(self._os_mknod_msg_arg,))
 
+    @_handles_calls(*(('os', function) for function in _os_mode_checks))
+    @only_required_for_messages(*dict.fromkeys(msg_id for _, _, msg_id, _, _ in _os_mode_checks.values()))
+    def _check_os_mode(self, node, keywords):
+        modes_attr, msg_arg_attr, msg_id, args_idx, unix_only = _os_mode_checks[node.func.attrname]
+        if unix_only and not _IS_UNIX:
+            return
+        modes_allowed = getattr(self, modes_attr)
+        if not modes_allowed:
+            return
+        unsafe = self._unsafe_open_calls.pop(node, None)
+        if unsafe is None:
+            unsafe = not _is_allowed_mode(node, keywords, modes_allowed, args_idx=args_idx)
+        if unsafe:
+            self.add_message(msg_id, node=node, args=(getattr(self, msg_arg_attr),))
+
+    # NB: the aliases recorded here are needed by the checks on function calls and on with-statements
+    @only_required_for_messages(*visit_call.checks_msgs)
     def visit_import(self, node):
         """Visitor method called for astroid.Import nodes."""
-        for name, _ in node.names:
-            if name == 'pdb':
+        is_debug = False
+        for name, asname in node.names:
+            if name in _debug_modules:
                 # Cover:
                 #  * import pdb.
                 #  * import pdb as xxx.
-                self.add_message('avoid-debug-stmt', node=node)
-
-    def visit_importfrom(self, node):  # noqa: C901
-        """Visitor method called for astroid.ImportFrom nodes."""
-        if node.modname == 'pdb':
+                is_debug = True
+            if asname is not None and name in self._alias_modules:
+                self._import_aliases.add(asname)
+        if is_debug:
             self.add_message('avoid-debug-stmt', node=node)
-        elif node.modname == 'tempfile' and [name for (name, _) in node.names if name == 'mktemp']:
-            self.add_message('replace-mktemp', node=node)
-        elif node.modname in {'os.path', 'op'} and [name for (name, _) in node.names if name in {'relpath', 'abspath'}]:
-            self.add_message('replace-os-relpath-abspath', node=node)
-        elif (
-            node.modname == 'subprocess'
-            and [name for (name, _) in node.names if name in {'getoutput', 'getstatusoutput'}]
-        ) or (node.modname == 'asyncio' and [name for (name, _) in node.names if name == 'create_subprocess_shell']):
-            self.add_message('avoid-shell-true', node=node)
-        elif node.modname == 'os' and [name for (name, _) in node.names if name == 'system']:
-            self.add_message('avoid-os-system', node=node)
-        elif node.modname == 'os' and [name for (name, _) in node.names if name == 'popen']:
-            self.add_message('avoid-os-popen', node=node)
-        elif not _is_posix() and node.modname == 'shlex' and [name for (name, _) in node.names if name == 'quote']:
-            self.add_message('avoid-shlex-quote-on-non-posix', node=node)
-        elif node.modname == 'pickle' and [name for (name, _) in node.names if name in {'load', 'loads'}]:
-            self.add_message('avoid-pickle-load', node=node)
-        elif node.modname == 'marshal' and [name for (name, _) in node.names if name in {'load', 'loads'}]:
-            self.add_message('avoid-marshal-load', node=node)
-        elif node.modname == 'shelve' and [name for (name, _) in node.names if name == 'open']:
-            self.add_message('avoid-shelve-open', node=node)
 
+    @only_required_for_messages(
+        *dict.fromkeys(msg_id for rules in _importfrom_dispatch.values() for _, msg_id, _ in rules)
+    )
+    def visit_importfrom(self, node):
+        """Visitor method called for astroid.ImportFrom nodes."""
+        rules = _importfrom_dispatch.get(node.modname)
+        if rules is None:
+            return
+
+        imported = {name for name, _ in node.names}
+        for names, msg_id, non_posix_only in rules:
+            if names is None or not names.isdisjoint(imported):
+                if not non_posix_only or not _IS_POSIX:
+                    self.add_message(msg_id, node=node)
+                return
+
+    @only_required_for_messages('replace-builtin-open', 'os-open-unsafe-permissions', 'avoid-shelve-open')
     def visit_with(self, node):
         """Visitor method called for astroid.With nodes."""
+        os_open_modes_allowed = self._os_open_modes_allowed
         for item in node.items:
-            if item and isinstance(item[0], astroid.Call):
-                if self._os_open_modes_allowed:
-                    if _is_builtin_open_for_writing(item[0]):
-                        self.add_message('replace-builtin-open', node=node)
-                    elif _is_function_call(item[0], module='os', function='open') and not _is_allowed_mode(
-                        item[0], self._os_open_modes_allowed, args_idx=2
-                    ):
+            call = item[0]
+            if call.__class__ is astroid.Call:
+                self._check_with_item(node, call, os_open_modes_allowed)
+
+    def _check_with_item(self, node, call, os_open_modes_allowed):
+        func = call.func
+        if func.__class__ is astroid.Name:
+            if os_open_modes_allowed and func.name == 'open':
+                # NB: the call itself is visited right after this node, so save the result for visit_call()
+                unsafe = self._unsafe_open_calls[call] = _open_call_is_writing(call, _get_keywords(call))
+                if unsafe:
+                    self.add_message('replace-builtin-open', node=node)
+        elif func.__class__ is astroid.Attribute and func.attrname == 'open' and func.expr.__class__ is astroid.Name:
+            module = self._get_module_name(func.expr)
+            if os_open_modes_allowed:
+                if module == 'os':
+                    unsafe = self._unsafe_open_calls[call] = not _is_allowed_mode(
+                        call, _get_keywords(call), os_open_modes_allowed, args_idx=2
+                    )
+                    if unsafe:
                         self.add_message('os-open-unsafe-permissions', node=node)
-                elif _is_function_call(item[0], module='shelve', function='open'):
-                    self.add_message('avoid-shelve-open', node=node)
+            elif module == 'shelve':
+                self.add_message('avoid-shelve-open', node=node)
+
+    def leave_module(self, _node):
+        """Visitor method called when leaving astroid.Module nodes."""
+        self._unsafe_open_calls.clear()
+        self._import_aliases.clear()
 
+    @only_required_for_messages('avoid-assert')
     def visit_assert(self, node):
         """Visitor method called for astroid.Assert nodes."""
         self.add_message('avoid-assert', node=node)
@@ -652,14 +823,15 @@ class SecureCodingStandardChecker(BaseChecker):  # pylint: disable=too-many-inst
     def _set_mode_option(self, config_name, name, value):
         modes = _read_octal_mode_option(config_name, value, self.DEFAULT_MAX_MODE)
 
+        # NB: both `range` and `frozenset` objects support constant-time membership tests
         if isinstance(modes, int) and modes > 0:
-            setattr(self, f'_os_{name}_modes_allowed', list(range(modes + 1)))
+            setattr(self, f'_os_{name}_modes_allowed', range(modes + 1))
             setattr(self, f'_os_{name}_msg_arg', f'0 < mode < {oct(modes)}')
         elif modes:
-            setattr(self, f'_os_{name}_modes_allowed', modes)
+            setattr(self, f'_os_{name}_modes_allowed', frozenset(modes))
             setattr(self, f'_os_{name}_msg_arg', f'mode in {[oct(mode) for mode in modes]}')
         else:
-            getattr(self, f'_os_{name}_modes_allowed').clear()
+            setattr(self, f'_os_{name}_modes_allowed', frozenset())
 
     def set_os_open_allowed_modes(self, value):
         """
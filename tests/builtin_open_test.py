@@ -17,11 +17,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -97,3 +93,17 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         else:
             with self.assertNoMessages():
                 self.checker.visit_with(node)
+
+    @pytest.mark.parametrize('s', ['with ' + s + ' as fd: fd.read()' for s in _calls_not_ok])
+    def test_builtin_open_with_then_call(self, s):
+        node = astroid.extract_node(s + ' #@')
+        call = node.items[0][0]
+        self.checker.set_os_open_allowed_modes('True')
+        with self.assertAddsMessages(
+            MessageTest(msg_id='replace-builtin-open', node=node),
+            MessageTest(msg_id='replace-builtin-open', node=call),
+            ignore_position=True,
+        ):
+            self.checker.visit_with(node)
+            self.checker.visit_call(call)
+        assert not self.checker._unsafe_open_calls
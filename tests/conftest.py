@@ -0,0 +1,37 @@
+# Copyright 2021 Damien Nguyen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import platform
+
+import pylint_secure_coding_standard as pylint_scs
+
+import astroid
+import pytest
+
+
+@pytest.fixture(scope='session')
+def parse():
+    """Return a cached version of `astroid.extract_node()`; the checker only reads the nodes, so they can be shared."""
+    return functools.lru_cache(maxsize=None)(astroid.extract_node)
+
+
+@pytest.fixture
+def platform_system(request, monkeypatch):
+    """Pretend to run on the platform named by the (indirect) parameter value."""
+    monkeypatch.setattr(platform, 'system', lambda: request.param)
+    monkeypatch.setattr(pylint_scs, '_IS_POSIX', pylint_scs._is_posix())
+    monkeypatch.setattr(pylint_scs, '_IS_UNIX', pylint_scs._is_unix())
+    monkeypatch.setattr(pylint_scs, '_IS_WINDOWS', pylint_scs._is_windows())
+    return request.param
@@ -17,11 +17,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -38,7 +34,6 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
 
         with self.assertNoMessages():
             for node in nodes:
-                print(node)
                 self.checker.visit_call(node)
 
     @pytest.mark.parametrize(
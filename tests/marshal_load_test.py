@@ -17,11 +17,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -19,11 +19,11 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
+from pylint.testutils import MessageTest
 
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+
+def _one_expr(code):
+    return astroid.parse(code).body[-1].value
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -40,7 +40,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         ],
     )
     def test_chmod_get_mode(self, s, expected):  # noqa: PLR6301
-        node = astroid.extract_node(s + ' #@')
+        node = _one_expr(s)
         assert pylint_scs._chmod_get_mode(node) == expected
 
     @pytest.mark.parametrize(
@@ -51,7 +51,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         ],
     )
     def test_chmod_get_mode_invalid(self, s):  # noqa: PLR6301
-        node = astroid.extract_node(s + ' #@')
+        node = _one_expr(s)
         with pytest.raises(ValueError, match='Do not know how to process'):
             pylint_scs._chmod_get_mode(node)
 
@@ -64,7 +64,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         ],
     )
     def test_chmod_get_mode_unop(self, s, expected):  # noqa: PLR6301
-        node = astroid.extract_node(s + ' #@')
+        node = _one_expr(s)
         assert pylint_scs._chmod_get_mode(node) == expected
 
     @pytest.mark.parametrize(
@@ -82,17 +82,18 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         ],
     )
     def test_chmod_get_mode_binop(self, s, expected):  # noqa: PLR6301
-        node = astroid.extract_node(s + ' #@')
+        node = _one_expr(s)
         assert pylint_scs._chmod_get_mode(node) == expected
 
     @pytest.mark.parametrize(
-        ('platform', 'enabled_platform'),
+        ('platform_system', 'enabled_platform'),
         [
             ('Linux', True),
             ('Darwin', True),
             ('Java', True),
             ('Windows', False),
         ],
+        indirect=['platform_system'],
     )
     @pytest.mark.parametrize('fname', ['"file.txt"', 'fname'])
     @pytest.mark.parametrize('arg_type', ['', 'mode='], ids=('arg', 'keyword'))
@@ -116,18 +117,16 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             'S_IREAD | S_IWRITE',
             'S_IRUSR | S_IWUSR | S_IXUSR',
         ],
-        ids=lambda s: s or '<empty>',
+        ids=['<empty>', 'S_IREAD', 'S_IREAD | S_IWRITE', 'S_IRUSR | S_IWUSR | S_IXUSR'],
     )
-    def test_chmod(self, mocker, platform, enabled_platform, fname, arg_type, forbidden, s):  # noqa: PLR0917
-        mocker.patch('platform.system', return_value=platform)
-
+    @pytest.mark.usefixtures('platform_system')
+    def test_chmod(self, enabled_platform, fname, arg_type, forbidden, s, parse):  # noqa: PLR0917
         if s:
             code = f'os.chmod({fname}, {arg_type}{s} | {forbidden}) #@'
         else:
             code = f'os.chmod({fname}, {arg_type} {forbidden}) #@'
 
-        print(code)
-        node = astroid.extract_node(code)
+        node = parse(code)
         if enabled_platform and forbidden != 'S_IRGRP':
             with self.assertAddsMessages(
                 MessageTest(msg_id='os-chmod-unsafe-permissions', node=node), ignore_position=True
@@ -137,7 +136,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             with self.assertNoMessages():
                 self.checker.visit_call(node)
 
-    @pytest.mark.parametrize('platform', ['Linux', 'Darwin', 'Java', 'Windows'])
+    @pytest.mark.parametrize('platform_system', ['Linux', 'Darwin', 'Java', 'Windows'], indirect=True)
     @pytest.mark.parametrize(
         's',
         [
@@ -147,27 +146,26 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             'os.chmod("file.txt", mode=mode)',
         ],
     )
-    def test_chmod_no_warning(self, mocker, platform, s):
-        mocker.patch('platform.system', return_value=platform)
-
-        node = astroid.extract_node(s)
+    @pytest.mark.usefixtures('platform_system')
+    def test_chmod_no_warning(self, s, parse):
+        node = parse(s)
         with self.assertNoMessages():
             self.checker.visit_call(node)
 
     @pytest.mark.parametrize(
-        ('platform', 'enabled_platform'),
+        ('platform_system', 'enabled_platform'),
         [
             ('Linux', True),
             ('Darwin', True),
             ('Java', True),
             ('Windows', False),
         ],
+        indirect=['platform_system'],
     )
     @pytest.mark.parametrize('s', ['os.chmod("file")'])
-    def test_chmod_invalid_raise(self, mocker, platform, enabled_platform, s):
-        mocker.patch('platform.system', return_value=platform)
-
-        node = astroid.extract_node(s)
+    @pytest.mark.usefixtures('platform_system')
+    def test_chmod_invalid_raise(self, enabled_platform, s, parse):
+        node = parse(s)
         if enabled_platform:
             with pytest.raises(RuntimeError):
                 self.checker.visit_call(node)
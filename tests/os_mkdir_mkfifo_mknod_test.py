@@ -14,9 +14,9 @@
 
 import pylint_secure_coding_standard as pylint_scs
 
-import astroid
 import pylint.testutils
 import pytest
+from pylint.testutils import MessageTest
 
 _os_function_strings = {
     'mkdir': (
@@ -44,16 +44,10 @@ _os_function_strings = {
 }
 
 
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
-
-
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
     CHECKER_CLASS = pylint_scs.SecureCodingStandardChecker
 
-    @pytest.mark.parametrize('platform', ['Linux', 'Darwin', 'Java', 'Windows'])
+    @pytest.mark.parametrize('platform_system', ['Linux', 'Darwin', 'Java', 'Windows'], indirect=True)
     @pytest.mark.parametrize('function', ['mkdir', 'mkfifo', 'mknod'])
     @pytest.mark.parametrize('option', [False, True])
     @pytest.mark.parametrize(
@@ -83,23 +77,24 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             'os.mknod(dir_name, mode=mode)',
         ],
     )
-    def test_os_function_ok(self, mocker, platform, function, option, s):
-        mocker.patch('platform.system', return_value=platform)
+    @pytest.mark.usefixtures('platform_system')
+    def test_os_function_ok(self, function, option, s, parse):
         getattr(self.checker, f'set_os_{function}_allowed_modes')(str(option))
 
-        node = astroid.extract_node(s + ' #@')
+        node = parse(s + ' #@')
 
         with self.assertNoMessages():
             self.checker.visit_call(node)
 
     @pytest.mark.parametrize(
-        ('platform', 'enabled_platform'),
+        ('platform_system', 'enabled_platform'),
         [
             ('Linux', True),
             ('Darwin', True),
             ('Java', False),
             ('Windows', False),
         ],
+        indirect=['platform_system'],
     )
     @pytest.mark.parametrize(
         'option',
@@ -108,12 +103,11 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
     @pytest.mark.parametrize(
         ('function', 's'), [(function, s) for function, tests in _os_function_strings.items() for s in tests]
     )
-    def test_os_function_call(self, mocker, platform, enabled_platform, function, option, s):  # noqa: PLR0917
-        mocker.patch('platform.system', return_value=platform)
+    @pytest.mark.usefixtures('platform_system')
+    def test_os_function_call(self, enabled_platform, function, option, s, parse):
         getattr(self.checker, f'set_os_{function}_allowed_modes')(str(option))
 
-        print(s + ' #@')
-        node = astroid.extract_node(s + ' #@')
+        node = parse(s + ' #@')
         if enabled_platform and option:
             with self.assertAddsMessages(
                 MessageTest(
@@ -17,11 +17,89 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
+from pylint.testutils import MessageTest
 
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+# NB: modes just above the default maximum (0o755) and modes on either side of an explicit 0o755 limit
+_modes_above_default = [0o756, 0o757, 0o760, 0o775, 0o777]
+_modes_above_default_ids = [oct(mode) for mode in _modes_above_default]
+_modes_around_limit = [0o750, 0o754, 0o755, 0o756, 0o760]
+_modes_around_limit_ids = [oct(mode) for mode in _modes_around_limit]
+
+
+@pytest.fixture(scope='module')
+def os_open_ok_nodes():
+    nodes = astroid.extract_node(
+        """
+        int(0) #@
+        foo() #@
+        os.open("file.txt") #@
+        os.open("file.txt", flags, mode) #@
+        os.open("file.txt", os.O_RDONLY) #@
+        os.open("file.txt", os.O_RDONLY, mode) #@
+        os.open("file.txt", os.O_RDONLY, 0o644) #@
+        os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) #@
+        os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) #@
+        os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) #@
+        os.open("file.txt", os.O_RDONLY, mode=mode) #@
+        os.open("file.txt", os.O_RDONLY, mode=0o644) #@
+        os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=mode) #@
+        os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) #@
+        bla.open("file.txt") #@
+        bla.open("file.txt", os.O_RDONLY) #@
+        bla.open("file.txt", flags=os.O_RDONLY) #@
+        bla.open("file.txt", os.O_RDONLY, mode) #@
+        bla.open("file.txt", os.O_RDONLY, 0o644) #@
+        bla.open("file.txt", os.O_RDONLY, 0o777) #@
+        bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) #@
+        bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) #@
+        bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) #@
+        bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o777) #@
+        bla.open("file.txt", os.O_RDONLY, mode=mode) #@
+        bla.open("file.txt", os.O_RDONLY, mode=0o644) #@
+        bla.open("file.txt", os.O_RDONLY, mode=0o777) #@
+        bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=mode) #@
+        bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) #@
+        bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=0o777) #@
+        with os.open("file.txt") as fd: fd.read() #@
+        with os.open("file.txt", flags, mode) as fd: fd.read() #@
+        with os.open("file.txt", os.O_RDONLY) as fd: fd.read() #@
+        with os.open("file.txt", os.O_RDONLY, mode) as fd: fd.read() #@
+        with os.open("file.txt", os.O_RDONLY, 0o644) as fd: fd.read() #@
+        with os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) as fd: fd.read() #@
+        with os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) as fd: fd.read() #@
+        with os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) as fd: fd.read() #@
+        with os.open("file.txt", flags=flags, mode=mode) as fd: fd.read() #@
+        with os.open("file.txt", flags=os.O_RDONLY, mode=mode) as fd: fd.read() #@
+        with os.open("file.txt", flags=os.O_RDONLY, mode=0o644) as fd: fd.read() #@
+        with os.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=mode) as fd: fd.read() #@
+        with os.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) as fd: fd.read() #@
+        with bla.open("file.txt") as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY) as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY, mode) as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY, 0o644) as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY, 0o777) as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) as fd: fd.read() #@
+        with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o777) as fd: fd.read() #@
+        with bla.open("file.txt", flags=os.O_RDONLY) as fd: fd.read() #@
+        with bla.open("file.txt", flags=os.O_RDONLY, mode=mode) as fd: fd.read() #@
+        with bla.open("file.txt", flags=os.O_RDONLY, mode=0o644) as fd: fd.read() #@
+        with bla.open("file.txt", flags=os.O_RDONLY, mode=0o777) as fd: fd.read() #@
+        with bla.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=mode) as fd: fd.read() #@
+        with bla.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) as fd: fd.read() #@
+        with bla.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=0o777) as fd: fd.read() #@
+        """
+    )
+
+    call_nodes = []
+    with_nodes = []
+    for node in nodes:
+        if isinstance(node, astroid.With):
+            with_nodes.append(node)
+        else:
+            call_nodes.append(node)
+    return call_nodes, with_nodes
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -31,84 +109,10 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         'arg',
         ['True', '0o644', '0o644,'],
     )
-    def test_os_open_ok(self, arg):
-        nodes = astroid.extract_node(
-            """
-            int(0) #@
-            foo() #@
-            os.open("file.txt") #@
-            os.open("file.txt", flags, mode) #@
-            os.open("file.txt", os.O_RDONLY) #@
-            os.open("file.txt", os.O_RDONLY, mode) #@
-            os.open("file.txt", os.O_RDONLY, 0o644) #@
-            os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) #@
-            os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) #@
-            os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) #@
-            os.open("file.txt", os.O_RDONLY, mode=mode) #@
-            os.open("file.txt", os.O_RDONLY, mode=0o644) #@
-            os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=mode) #@
-            os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) #@
-            bla.open("file.txt") #@
-            bla.open("file.txt", os.O_RDONLY) #@
-            bla.open("file.txt", flags=os.O_RDONLY) #@
-            bla.open("file.txt", os.O_RDONLY, mode) #@
-            bla.open("file.txt", os.O_RDONLY, 0o644) #@
-            bla.open("file.txt", os.O_RDONLY, 0o777) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o777) #@
-            bla.open("file.txt", os.O_RDONLY, mode=mode) #@
-            bla.open("file.txt", os.O_RDONLY, mode=0o644) #@
-            bla.open("file.txt", os.O_RDONLY, mode=0o777) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=mode) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) #@
-            bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode=0o777) #@
-            with os.open("file.txt") as fd: fd.read() #@
-            with os.open("file.txt", flags, mode) as fd: fd.read() #@
-            with os.open("file.txt", os.O_RDONLY) as fd: fd.read() #@
-            with os.open("file.txt", os.O_RDONLY, mode) as fd: fd.read() #@
-            with os.open("file.txt", os.O_RDONLY, 0o644) as fd: fd.read() #@
-            with os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) as fd: fd.read() #@
-            with os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) as fd: fd.read() #@
-            with os.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) as fd: fd.read() #@
-            with os.open("file.txt", flags=flags, mode=mode) as fd: fd.read() #@
-            with os.open("file.txt", flags=os.O_RDONLY, mode=mode) as fd: fd.read() #@
-            with os.open("file.txt", flags=os.O_RDONLY, mode=0o644) as fd: fd.read() #@
-            with os.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=mode) as fd: fd.read() #@
-            with os.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) as fd: fd.read() #@
-            with bla.open("file.txt") as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY) as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY, mode) as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY, 0o644) as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY, 0o777) as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW) as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, mode) as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o644) as fd: fd.read() #@
-            with bla.open("file.txt", os.O_RDONLY | os.O_NOFOLLOW, 0o777) as fd: fd.read() #@
-            with bla.open("file.txt", flags=os.O_RDONLY) as fd: fd.read() #@
-            with bla.open("file.txt", flags=os.O_RDONLY, mode=mode) as fd: fd.read() #@
-            with bla.open("file.txt", flags=os.O_RDONLY, mode=0o644) as fd: fd.read() #@
-            with bla.open("file.txt", flags=os.O_RDONLY, mode=0o777) as fd: fd.read() #@
-            with bla.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=mode) as fd: fd.read() #@
-            with bla.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=0o644) as fd: fd.read() #@
-            with bla.open("file.txt", flags=os.O_RDONLY | os.O_NOFOLLOW, mode=0o777) as fd: fd.read() #@
-            """
-        )
-
+    def test_os_open_ok(self, arg, os_open_ok_nodes):
+        call_nodes, with_nodes = os_open_ok_nodes
         self.checker.set_os_open_allowed_modes(arg)
 
-        call_nodes = []
-        with_nodes = []
-
-        # Find index of first line starting with 'with'
-        for node in nodes:
-            if isinstance(node, astroid.With):
-                with_nodes.append(node)
-            else:
-                call_nodes.append(node)
-
         with self.assertNoMessages():
             for node in call_nodes:
                 self.checker.visit_call(node)
@@ -117,7 +121,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
 
     # ==========================================================================
 
-    @pytest.mark.parametrize('mode', range(0o756, 0o777 + 1), ids=oct)
+    @pytest.mark.parametrize('mode', _modes_above_default, ids=_modes_above_default_ids)
     @pytest.mark.parametrize(
         ('arg', 'expected_warning'),
         [
@@ -125,10 +129,9 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             ('True', True),
         ],
     )
-    def test_os_open_call_default_modes(self, mode, arg, expected_warning):
+    def test_os_open_call_default_modes(self, mode, arg, expected_warning, parse):
         code = f'os.open("file.txt", os.O_WRONLY, 0o{mode:o}) #@'
-        print(code)
-        node = astroid.extract_node(code)
+        node = parse(code)
         self.checker.set_os_open_allowed_modes(arg)
         if expected_warning:
             with self.assertAddsMessages(
@@ -142,7 +145,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
 
     # --------------------------------------------------------------------------
 
-    @pytest.mark.parametrize('mode', range(0o750, 0o761), ids=oct)
+    @pytest.mark.parametrize('mode', _modes_around_limit, ids=_modes_around_limit_ids)
     @pytest.mark.parametrize(
         'call_mode',
         [
@@ -159,8 +162,8 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         ],
         ids=('False-False', '[0o755]-True'),
     )
-    def test_os_open_call(self, mode, call_mode, arg, expected_warning):
-        node = astroid.extract_node(call_mode.format(mode))
+    def test_os_open_call(self, mode, call_mode, arg, expected_warning, parse):
+        node = parse(call_mode.format(mode))
         self.checker.set_os_open_allowed_modes(arg)
         if expected_warning and mode != 0o755:
             with self.assertAddsMessages(
@@ -174,7 +177,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
 
     # ==========================================================================
 
-    @pytest.mark.parametrize('mode', range(0o756, 0o777 + 1), ids=oct)
+    @pytest.mark.parametrize('mode', _modes_above_default, ids=_modes_above_default_ids)
     @pytest.mark.parametrize(
         'call_mode',
         [
@@ -190,8 +193,8 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             ('True', True),
         ],
     )
-    def test_os_open_with_default_modes(self, mode, call_mode, arg, expected_warning):
-        node = astroid.extract_node(call_mode.format(mode))
+    def test_os_open_with_default_modes(self, mode, call_mode, arg, expected_warning, parse):
+        node = parse(call_mode.format(mode))
         self.checker.set_os_open_allowed_modes(arg)
         if expected_warning:
             with self.assertAddsMessages(
@@ -204,7 +207,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
 
     # --------------------------------------------------------------------------
 
-    @pytest.mark.parametrize('mode', range(0o750, 0o761), ids=oct)
+    @pytest.mark.parametrize('mode', _modes_around_limit, ids=_modes_around_limit_ids)
     @pytest.mark.parametrize(
         ('arg', 'expected_warning'),
         [
@@ -212,8 +215,8 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             ('0o755,', True),
         ],
     )
-    def test_os_open_with(self, mode, arg, expected_warning):
-        node = astroid.extract_node(f'with os.open("file.txt", os.O_WRONLY, 0o{mode:o}) as fd: fd.read() #@')
+    def test_os_open_with(self, mode, arg, expected_warning, parse):
+        node = parse(f'with os.open("file.txt", os.O_WRONLY, 0o{mode:o}) as fd: fd.read() #@')
         self.checker.set_os_open_allowed_modes(arg)
         if expected_warning and mode != 0o755:
             with self.assertAddsMessages(
@@ -223,3 +226,37 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         else:
             with self.assertNoMessages():
                 self.checker.visit_with(node)
+
+    @pytest.mark.parametrize(('mode', 'expected_warning'), [(0o644, False), (0o777, True)], ids=['0o644', '0o777'])
+    def test_os_open_with_then_call(self, mode, expected_warning, parse):
+        node = parse(f'with os.open("file.txt", os.O_WRONLY, 0o{mode:o}) as fd: fd.read() #@')
+        call = node.items[0][0]
+        self.checker.set_os_open_allowed_modes('True')
+        if expected_warning:
+            with self.assertAddsMessages(
+                MessageTest(msg_id='os-open-unsafe-permissions', node=node),
+                MessageTest(msg_id='os-open-unsafe-permissions', node=call, args=(self.checker._os_open_msg_arg,)),
+                ignore_position=True,
+            ):
+                self.checker.visit_with(node)
+                self.checker.visit_call(call)
+        else:
+            with self.assertNoMessages():
+                self.checker.visit_with(node)
+                self.checker.visit_call(call)
+        assert not self.checker._unsafe_open_calls
+
+    def test_os_open_with_module_alias(self):
+        node = astroid.extract_node(
+            'import os as _os\nwith _os.open("file.txt", _os.O_WRONLY, 0o777) as fd: fd.read() #@'
+        )
+        self.checker.set_os_open_allowed_modes('True')
+        with self.assertAddsMessages(
+            MessageTest(msg_id='os-open-unsafe-permissions', node=node),
+            MessageTest(
+                msg_id='os-open-unsafe-permissions', node=node.items[0][0], args=(self.checker._os_open_msg_arg,)
+            ),
+            ignore_position=True,
+        ):
+            self.walk(node.root())
+        assert not self.checker._unsafe_open_calls
@@ -17,11 +17,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -73,3 +69,16 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         node = astroid.extract_node(s + ' #@')
         with self.assertAddsMessages(MessageTest(msg_id='replace-os-relpath-abspath', node=node), ignore_position=True):
             self.checker.visit_call(node)
+
+    @pytest.mark.parametrize(
+        's',
+        [
+            'import os as _os\n_os.path.abspath("../file.txt")',
+            'import os as _os\n_os.path.relpath("file.txt")',
+            'import os.path as op\nop.relpath("file.txt")',
+        ],
+    )
+    def test_shell_true_call_module_alias(self, s):
+        node = astroid.extract_node(s + ' #@')
+        with self.assertAddsMessages(MessageTest(msg_id='replace-os-relpath-abspath', node=node), ignore_position=True):
+            self.walk(node.root())
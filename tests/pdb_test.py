@@ -17,11 +17,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -44,10 +40,12 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         [
             'import pdb',
             'import pdb, six',
+            'import six, pdb as debugger',
+            'import pdb, pdb as debugger',
         ],
     )
-    def test_pdb_import(self, s):
-        node = astroid.extract_node(s + ' #@')
+    def test_pdb_import(self, s, parse):
+        node = parse(s + ' #@')
         with self.assertAddsMessages(MessageTest(msg_id='avoid-debug-stmt', node=node), ignore_position=True):
             self.checker.visit_import(node)
 
@@ -55,8 +53,8 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         's',
         ['from pdb import set_trace'],
     )
-    def test_pdb_importfrom(self, s):
-        node = astroid.extract_node(s + ' #@')
+    def test_pdb_importfrom(self, s, parse):
+        node = parse(s + ' #@')
         with self.assertAddsMessages(MessageTest(msg_id='avoid-debug-stmt', node=node), ignore_position=True):
             self.checker.visit_importfrom(node)
 
@@ -69,7 +67,16 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             'Pdb(skip=["django.*"])',
         ],
     )
-    def test_pdb_call(self, s):
-        node = astroid.extract_node(s + ' #@')
+    def test_pdb_call(self, s, parse):
+        node = parse(s + ' #@')
         with self.assertAddsMessages(MessageTest(msg_id='avoid-debug-stmt', node=node), ignore_position=True):
             self.checker.visit_call(node)
+
+    def test_pdb_call_module_alias(self):
+        import_node, call_node = astroid.extract_node('import pdb as p #@\np.set_trace() #@')
+        with self.assertAddsMessages(
+            MessageTest(msg_id='avoid-debug-stmt', node=import_node),
+            MessageTest(msg_id='avoid-debug-stmt', node=call_node),
+            ignore_position=True,
+        ):
+            self.walk(import_node.root())
@@ -14,15 +14,19 @@
 
 import pylint_secure_coding_standard as pylint_scs
 
+import astroid
 import pylint.testutils
 import pytest
+from pylint.lint import Run
+from pylint.reporters import CollectingReporter
+from pylint.testutils import MessageTest
 
-_default_modes = list(range(pylint_scs.SecureCodingStandardChecker.DEFAULT_MAX_MODE + 1))
+_default_modes = tuple(range(pylint_scs.SecureCodingStandardChecker.DEFAULT_MAX_MODE + 1))
 
 
 def _id_func(arg):
     _max_len = 4
-    if arg == _default_modes:
+    if arg is _default_modes:
         return 'default_modes'
     if isinstance(arg, list) and len(arg) > _max_len:
         return '[{}...{}]'.format(
@@ -54,13 +58,18 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             ('1', 1),
             ('493', 493),
             ('0o755', 0o755),
+            ('755', 0o755),
+            ('+755', 0o755),
+            ('7_55', 0o755),
+            ('8', 8),
+            ('19', 19),
+            ('\u0667\u0667', 0o77),
             ('0o755,', [0o755]),
             ('0o644, 0o755,', [0o644, 0o755]),
         ],
         ids=_id_func,
     )
     def test_read_octal_mode_option(self, arg, expected):  # noqa: PLR6301
-        print(f'INFO: expected: {expected}')
         assert pylint_scs._read_octal_mode_option('test', arg, _default_modes) == expected
 
     @pytest.mark.parametrize('arg', ['', ',', ',,', 'nope', 'asd', 'a,', '493, a'])
@@ -82,6 +91,44 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         ids=_id_func,
     )
     def test_os_allowed_mode(self, function, arg, allowed_modes):
-        print(f'INFO: allowed_modes: {allowed_modes}')
         getattr(self.checker, f'set_os_{function}_allowed_modes')(arg)
-        assert getattr(self.checker, f'_os_{function}_modes_allowed') == allowed_modes
+        assert sorted(getattr(self.checker, f'_os_{function}_modes_allowed')) == list(allowed_modes)
+
+    def test_disabled_messages_are_not_dispatched(self, monkeypatch):
+        monkeypatch.setattr(
+            self.linter, 'is_message_enabled', lambda msg_id, *_args, **_kwargs: msg_id != 'avoid-os-system'
+        )
+        self.checker.open()
+
+        nodes = astroid.extract_node(
+            """
+            os.system("ls") #@
+            os.path.abspath("file.txt") #@
+            """
+        )
+        assert ('os', 'system') not in self.checker._attr_call_dispatch
+        with self.assertAddsMessages(
+            MessageTest(msg_id='replace-os-relpath-abspath', node=nodes[1]), ignore_position=True
+        ):
+            for node in nodes:
+                self.checker.visit_call(node)
+
+    @pytest.mark.parametrize(('disable', 'expected'), [('', ['avoid-eval-exec']), ('avoid-eval-exec', [])])
+    def test_inline_enable_of_disabled_message(self, tmp_path, disable, expected):  # noqa: PLR6301
+        # NB: the checks for messages disabled for the whole run are skipped, so enabling them inline has no effect
+        (tmp_path / 'pylintrc').write_text('')
+        module = tmp_path / 'module.py'
+        module.write_text('x = eval("y")  # pylint: enable=avoid-eval-exec\n')
+        reporter = CollectingReporter()
+        Run(
+            [
+                str(module),
+                f'--rcfile={tmp_path / "pylintrc"}',
+                '--load-plugins=pylint_secure_coding_standard',
+                '--persistent=n',
+                f'--disable={disable}',
+            ],
+            reporter=reporter,
+            exit=False,
+        )
+        assert [msg.symbol for msg in reporter.messages if msg.symbol == 'avoid-eval-exec'] == expected
@@ -17,11 +17,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -103,7 +99,38 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             ('os.popen("cat", mode="w", buffering=1)', 'avoid-os-popen'),
         ],
     )
-    def test_shell_true_call(self, s, msg_id):
-        node = astroid.extract_node(s + ' #@')
+    def test_shell_true_call(self, s, msg_id, parse):
+        node = parse(s + ' #@')
         with self.assertAddsMessages(MessageTest(msg_id=msg_id, node=node), ignore_position=True):
             self.checker.visit_call(node)
+
+    @pytest.mark.parametrize(
+        ('s', 'msg_id'),
+        [
+            ('import os as _os\n_os.system("ls -l")', 'avoid-os-system'),
+            ('import os as _os\n_os.popen("cat")', 'avoid-os-popen'),
+            ('import subprocess as proc\nproc.run(["cat", "/etc/passwd"], shell=True)', 'avoid-shell-true'),
+            ('import subprocess as proc\nproc.getoutput("ls /bin/ls")', 'avoid-shell-true'),
+            ('import subprocess as proc\ndef f():\n    proc.getoutput("ls /bin/ls")', 'avoid-shell-true'),
+        ],
+    )
+    def test_shell_true_call_module_alias(self, s, msg_id):
+        node = astroid.extract_node(s + ' #@')
+        with self.assertAddsMessages(MessageTest(msg_id=msg_id, node=node), ignore_position=True):
+            # NB: walk the whole module since the aliases are recorded when visiting the import statements
+            self.walk(node.root())
+
+    @pytest.mark.parametrize(
+        's',
+        [
+            'import os as _os\n_os.getcwd()',
+            'import subprocess as proc\nproc.run(["cat", "/etc/passwd"], shell=False)',
+            'from os import path as _os\n_os.system("ls -l")',
+            '_os = get_os()\n_os.system("ls -l")',
+            '_os.system("ls -l")',
+        ],
+    )
+    def test_shell_true_call_module_alias_ok(self, s):
+        node = astroid.extract_node(s + ' #@')
+        with self.assertNoMessages():
+            self.walk(node.root())
@@ -21,11 +21,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -65,3 +61,12 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
         node = astroid.extract_node(s + ' #@')
         with self.assertAddsMessages(MessageTest(msg_id='avoid-shelve-open', node=node), ignore_position=True):
             self.checker.visit_importfrom(node)
+
+    def test_shelve_open_with_module_alias(self):
+        with_node = astroid.extract_node('import shelve as sh\nwith sh.open("file.txt") as fd: fd.read() #@')
+        with self.assertAddsMessages(
+            MessageTest(msg_id='avoid-shelve-open', node=with_node),
+            MessageTest(msg_id='avoid-shelve-open', node=with_node.items[0][0]),
+            ignore_position=True,
+        ):
+            self.walk(with_node.root())
@@ -14,33 +14,28 @@
 
 import pylint_secure_coding_standard as pylint_scs
 
-import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
     CHECKER_CLASS = pylint_scs.SecureCodingStandardChecker
 
     @pytest.mark.parametrize(
-        ('platform', 'expected_success'),
+        ('platform_system', 'expected_success'),
         [
             ('Linux', True),
             ('Darwin', True),
             ('Java', False),
             ('Windows', False),
         ],
+        indirect=['platform_system'],
     )
     @pytest.mark.parametrize('s', ['from shlex import quote'])
-    def test_shlex_quote_importfrom(self, mocker, platform, expected_success, s):
-        mocker.patch('platform.system', return_value=platform)
-
-        node = astroid.extract_node(s + ' #@')
+    @pytest.mark.usefixtures('platform_system')
+    def test_shlex_quote_importfrom(self, expected_success, s, parse):
+        node = parse(s + ' #@')
         if expected_success:
             self.checker.visit_importfrom(node)
         else:
@@ -50,13 +45,14 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
                 self.checker.visit_importfrom(node)
 
     @pytest.mark.parametrize(
-        ('platform', 'expected_success'),
+        ('platform_system', 'expected_success'),
         [
             ('Linux', True),
             ('Darwin', True),
             ('Java', False),
             ('Windows', False),
         ],
+        indirect=['platform_system'],
     )
     @pytest.mark.parametrize(
         's',
@@ -65,10 +61,9 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             'shlex.quote(command_str)',
         ],
     )
-    def test_shlex_call_quote(self, mocker, platform, expected_success, s):
-        mocker.patch('platform.system', return_value=platform)
-
-        node = astroid.extract_node(s + ' #@')
+    @pytest.mark.usefixtures('platform_system')
+    def test_shlex_call_quote(self, expected_success, s, parse):
+        node = parse(s + ' #@')
         if expected_success:
             self.checker.visit_call(node)
         else:
@@ -17,11 +17,7 @@ import pylint_secure_coding_standard as pylint_scs
 import astroid
 import pylint.testutils
 import pytest
-
-try:
-    from pylint.testutils import MessageTest
-except ImportError:
-    from pylint.testutils import Message as MessageTest
+from pylint.testutils import MessageTest
 
 
 class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
@@ -42,7 +38,6 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
 
         with self.assertNoMessages():
             for node in nodes:
-                print(node)
                 self.checker.visit_call(node)
 
     @pytest.mark.parametrize(
@@ -61,7 +56,7 @@ class TestSecureCodingStandardChecker(pylint.testutils.CheckerTestCase):
             'yaml.load("!!python/object/new:os.system [echo EXPLOIT!]", FullLoader)',
         ],
     )
-    def test_yaml_not_ok(self, s):
-        node = astroid.extract_node(s + ' #@')
+    def test_yaml_not_ok(self, s, parse):
+        node = parse(s + ' #@')
         with self.assertAddsMessages(MessageTest(msg_id='avoid-yaml-unsafe-load', node=node), ignore_position=True):
             self.checker.visit_call(node)